@@ -36,12 +36,11 @@ def _take(bb: BlockBuilder, call: Call) -> Expr:
 @register_legalize("relax.strided_slice")
 def _strided_slice(bb: BlockBuilder, call: Call) -> Expr:
     def _relax_tuple_to_tir(relax_tuple):
-        output = []
-        for field in relax_tuple.struct_info.fields:
-            assert isinstance(field, PrimStructInfo)
-            assert field.value is not None
-            output.append(field.value)
-        return output
+        fields = list(relax_tuple.struct_info.fields)
+        assert all(
+            isinstance(field, PrimStructInfo) and field.value is not None for field in fields
+        )
+        return [field.value for field in fields]
 
     if len(call.args) == 4:
         data, axes, begin, end = call.args
@@ -91,10 +90,17 @@ def _dynamic_strided_slice(bb: BlockBuilder, call: Call) -> Expr:
                 len2 = tir.ceildiv(end - begin, strides)
                 return tir.Select(strides < 0, len1, len2)
 
-            length = tir.const(-1, "int64")
-            for idx in range(data.ndim):
-                length = tir.Select(i == tir.const(idx, "int64"), data.shape[idx], length)
-
+            def select_extent(lo, hi):
+                # Binary search over the axes in [lo, hi), so that the select
+                # tree picking `data.shape[i]` has logarithmic depth.
+                if hi - lo == 1:
+                    return data.shape[lo]
+                mid = (lo + hi) // 2
+                return tir.Select(
+                    i < tir.const(mid, "int64"), select_extent(lo, mid), select_extent(mid, hi)
+                )
+
+            length = select_extent(0, data.ndim) if data.ndim > 0 else tir.const(-1, "int64")
             return get_length(begin[i], end[i], strides[i], length)
 
         return te.compute((begin.shape[0],), _compute, name="T_shape_func_strided_slice_dynamic")
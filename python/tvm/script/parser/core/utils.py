@@ -16,11 +16,10 @@
 # under the License.
 """TVM Script Parser utils"""
 import inspect
+import linecache
 from types import FrameType
 from typing import Any, Callable, Dict, List
 
-from .diagnostics import findsource
-
 
 def get_func_nonlocals(func):
     """A modified version of `inspect.getclosurevars`"""
@@ -87,7 +86,11 @@ def inspect_class_capture(cls: type) -> Dict[str, Any]:
     return result
 
 
-def is_defined_in_class(frames: List[FrameType], obj: Any) -> bool:
+def _is_ir_module_decorator(line: str) -> bool:
+    return line.startswith("@") and "ir_module" in line
+
+
+def is_defined_in_class(frames: List[FrameType]) -> bool:
     """Check whether a object is defined in a class scope.
 
     Parameters
@@ -106,13 +109,13 @@ def is_defined_in_class(frames: List[FrameType], obj: Any) -> bool:
         if code_context is None:
             return False
         line = code_context[0].strip()
-        if line.startswith("@") and "ir_module" in line:
+        if _is_ir_module_decorator(line):
             return True
         if line.startswith("class"):
             lineno = frame_info.lineno
             if lineno >= 2:
-                source, _ = findsource(obj)
-                line = source[lineno - 2].strip()
-                if line.startswith("@") and "ir_module" in line:
+                # Read the line above the class statement from the class body's file.
+                line = linecache.getline(frame_info.filename, lineno - 1).strip()
+                if _is_ir_module_decorator(line):
                     return True
     return False
@@ -65,7 +65,7 @@ def function(
     def decorator_wrapper(f):
         if not inspect.isfunction(f):
             raise TypeError(f"Expect a function, but got: {f}")
-        if utils.is_defined_in_class(orig_stack, f):
+        if utils.is_defined_in_class(orig_stack):
             return f
         return parse(f, utils.inspect_function_capture(f), check_well_formed=check_well_formed)
 
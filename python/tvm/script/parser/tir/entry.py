@@ -60,7 +60,7 @@ def prim_func(
     def decorator_wrapper(func):
         if not inspect.isfunction(func):
             raise TypeError(f"Expect a function, but got: {func}")
-        if utils.is_defined_in_class(outer_stack, func):
+        if utils.is_defined_in_class(outer_stack):
             return func
         f = parse(func, utils.inspect_function_capture(func), check_well_formed=check_well_formed)
         setattr(f, "__name__", func.__name__)
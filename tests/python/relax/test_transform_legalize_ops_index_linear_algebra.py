@@ -478,40 +478,18 @@ def test_dynamic_strided_slice():
                                         rxplaceholder_1[v_i] < T.int64(0),
                                         rxplaceholder_1[v_i]
                                         + T.Select(
-                                            v_i == T.int64(3),
-                                            T.int64(10),
-                                            T.Select(
-                                                v_i == T.int64(2),
-                                                T.int64(10),
-                                                T.Select(
-                                                    v_i == T.int64(1),
-                                                    T.int64(9),
-                                                    T.Select(
-                                                        v_i == T.int64(0),
-                                                        T.int64(8),
-                                                        T.int64(-1),
-                                                    ),
-                                                ),
-                                            ),
+                                            v_i < T.int64(2),
+                                            T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                            T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                         ),
                                         rxplaceholder_1[v_i],
                                     ),
                                     T.int64(-1),
                                 ),
                                 T.Select(
-                                    v_i == T.int64(3),
-                                    T.int64(10),
-                                    T.Select(
-                                        v_i == T.int64(2),
-                                        T.int64(10),
-                                        T.Select(
-                                            v_i == T.int64(1),
-                                            T.int64(9),
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(8), T.int64(-1)
-                                            ),
-                                        ),
-                                    ),
+                                    v_i < T.int64(2),
+                                    T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                    T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                 )
                                 - T.int64(1),
                             )
@@ -521,40 +499,18 @@ def test_dynamic_strided_slice():
                                         rxplaceholder_2[v_i] < T.int64(0),
                                         rxplaceholder_2[v_i]
                                         + T.Select(
-                                            v_i == T.int64(3),
-                                            T.int64(10),
-                                            T.Select(
-                                                v_i == T.int64(2),
-                                                T.int64(10),
-                                                T.Select(
-                                                    v_i == T.int64(1),
-                                                    T.int64(9),
-                                                    T.Select(
-                                                        v_i == T.int64(0),
-                                                        T.int64(8),
-                                                        T.int64(-1),
-                                                    ),
-                                                ),
-                                            ),
+                                            v_i < T.int64(2),
+                                            T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                            T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                         ),
                                         rxplaceholder_2[v_i],
                                     ),
                                     T.int64(-1),
                                 ),
                                 T.Select(
-                                    v_i == T.int64(3),
-                                    T.int64(10),
-                                    T.Select(
-                                        v_i == T.int64(2),
-                                        T.int64(10),
-                                        T.Select(
-                                            v_i == T.int64(1),
-                                            T.int64(9),
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(8), T.int64(-1)
-                                            ),
-                                        ),
-                                    ),
+                                    v_i < T.int64(2),
+                                    T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                    T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                 )
                                 - T.int64(1),
                             )
@@ -569,40 +525,18 @@ def test_dynamic_strided_slice():
                                         rxplaceholder_2[v_i] < T.int64(0),
                                         rxplaceholder_2[v_i]
                                         + T.Select(
-                                            v_i == T.int64(3),
-                                            T.int64(10),
-                                            T.Select(
-                                                v_i == T.int64(2),
-                                                T.int64(10),
-                                                T.Select(
-                                                    v_i == T.int64(1),
-                                                    T.int64(9),
-                                                    T.Select(
-                                                        v_i == T.int64(0),
-                                                        T.int64(8),
-                                                        T.int64(-1),
-                                                    ),
-                                                ),
-                                            ),
+                                            v_i < T.int64(2),
+                                            T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                            T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                         ),
                                         rxplaceholder_2[v_i],
                                     ),
                                     T.int64(0),
                                 ),
                                 T.Select(
-                                    v_i == T.int64(3),
-                                    T.int64(10),
-                                    T.Select(
-                                        v_i == T.int64(2),
-                                        T.int64(10),
-                                        T.Select(
-                                            v_i == T.int64(1),
-                                            T.int64(9),
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(8), T.int64(-1)
-                                            ),
-                                        ),
-                                    ),
+                                    v_i < T.int64(2),
+                                    T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                    T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                 ),
                             )
                             + rxplaceholder_3[v_i]
@@ -612,40 +546,18 @@ def test_dynamic_strided_slice():
                                         rxplaceholder_1[v_i] < T.int64(0),
                                         rxplaceholder_1[v_i]
                                         + T.Select(
-                                            v_i == T.int64(3),
-                                            T.int64(10),
-                                            T.Select(
-                                                v_i == T.int64(2),
-                                                T.int64(10),
-                                                T.Select(
-                                                    v_i == T.int64(1),
-                                                    T.int64(9),
-                                                    T.Select(
-                                                        v_i == T.int64(0),
-                                                        T.int64(8),
-                                                        T.int64(-1),
-                                                    ),
-                                                ),
-                                            ),
+                                            v_i < T.int64(2),
+                                            T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                            T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                         ),
                                         rxplaceholder_1[v_i],
                                     ),
                                     T.int64(0),
                                 ),
                                 T.Select(
-                                    v_i == T.int64(3),
-                                    T.int64(10),
-                                    T.Select(
-                                        v_i == T.int64(2),
-                                        T.int64(10),
-                                        T.Select(
-                                            v_i == T.int64(1),
-                                            T.int64(9),
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(8), T.int64(-1)
-                                            ),
-                                        ),
-                                    ),
+                                    v_i < T.int64(2),
+                                    T.Select(v_i < T.int64(1), T.int64(8), T.int64(9)),
+                                    T.Select(v_i < T.int64(3), T.int64(10), T.int64(10)),
                                 ),
                             )
                             - T.int64(1)
@@ -757,46 +669,24 @@ def test_dynamic_strided_slice_symbolic():
                                     T.Select(
                                         rxplaceholder[v_i] < T.int64(0),
                                         rxplaceholder[v_i]
-                                        + T.Select(
-                                            v_i == T.int64(1),
-                                            n,
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(10), T.int64(-1)
-                                            ),
-                                        ),
+                                        + T.Select(v_i < T.int64(1), T.int64(10), n),
                                         rxplaceholder[v_i],
                                     ),
                                     T.int64(-1),
                                 ),
-                                T.Select(
-                                    v_i == T.int64(1),
-                                    n,
-                                    T.Select(v_i == T.int64(0), T.int64(10), T.int64(-1)),
-                                )
-                                - T.int64(1),
+                                T.Select(v_i < T.int64(1), T.int64(10), n) - T.int64(1),
                             )
                             - T.min(
                                 T.max(
                                     T.Select(
                                         rxplaceholder_1[v_i] < T.int64(0),
                                         rxplaceholder_1[v_i]
-                                        + T.Select(
-                                            v_i == T.int64(1),
-                                            n,
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(10), T.int64(-1)
-                                            ),
-                                        ),
+                                        + T.Select(v_i < T.int64(1), T.int64(10), n),
                                         rxplaceholder_1[v_i],
                                     ),
                                     T.int64(-1),
                                 ),
-                                T.Select(
-                                    v_i == T.int64(1),
-                                    n,
-                                    T.Select(v_i == T.int64(0), T.int64(10), T.int64(-1)),
-                                )
-                                - T.int64(1),
+                                T.Select(v_i < T.int64(1), T.int64(10), n) - T.int64(1),
                             )
                             - rxplaceholder_2[v_i]
                             - T.int64(1)
@@ -808,22 +698,12 @@ def test_dynamic_strided_slice_symbolic():
                                     T.Select(
                                         rxplaceholder_1[v_i] < T.int64(0),
                                         rxplaceholder_1[v_i]
-                                        + T.Select(
-                                            v_i == T.int64(1),
-                                            n,
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(10), T.int64(-1)
-                                            ),
-                                        ),
+                                        + T.Select(v_i < T.int64(1), T.int64(10), n),
                                         rxplaceholder_1[v_i],
                                     ),
                                     T.int64(0),
                                 ),
-                                T.Select(
-                                    v_i == T.int64(1),
-                                    n,
-                                    T.Select(v_i == T.int64(0), T.int64(10), T.int64(-1)),
-                                ),
+                                T.Select(v_i < T.int64(1), T.int64(10), n),
                             )
                             + rxplaceholder_2[v_i]
                             - T.min(
@@ -831,22 +711,12 @@ def test_dynamic_strided_slice_symbolic():
                                     T.Select(
                                         rxplaceholder[v_i] < T.int64(0),
                                         rxplaceholder[v_i]
-                                        + T.Select(
-                                            v_i == T.int64(1),
-                                            n,
-                                            T.Select(
-                                                v_i == T.int64(0), T.int64(10), T.int64(-1)
-                                            ),
-                                        ),
+                                        + T.Select(v_i < T.int64(1), T.int64(10), n),
                                         rxplaceholder[v_i],
                                     ),
                                     T.int64(0),
                                 ),
-                                T.Select(
-                                    v_i == T.int64(1),
-                                    n,
-                                    T.Select(v_i == T.int64(0), T.int64(10), T.int64(-1)),
-                                ),
+                                T.Select(v_i < T.int64(1), T.int64(10), n),
                             )
                             - T.int64(1)
                         )